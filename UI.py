@@ -52,6 +52,9 @@ class ClueUI(tk.Tk):
 
         self._build_layout()
         self._bind_keys()
+
+        # Suggestion/accusation dialog is built once and reused
+        self.dialog = SuggestAccuseDialog(self)
         self._refresh_all()
 
         # Start first player's turn
@@ -92,7 +95,7 @@ class ClueUI(tk.Tk):
 
         hint = ttk.Label(
             board_frame,
-            text="Tip: Roll dice, then use arrow keys or the Move buttons.",
+            text="Tip: Roll dice, then use arrow keys, the Move buttons, or click a room entrance.",
             font=("Segoe UI", 9),
         )
         hint.pack(side=tk.TOP, anchor="w", pady=(6, 0))
@@ -128,6 +131,14 @@ class ClueUI(tk.Tk):
         self.btn_accuse.pack(side=tk.TOP, fill=tk.X, pady=(6, 0))
         self.btn_end.pack(side=tk.TOP, fill=tk.X, pady=(10, 0))
 
+        # Undo/Redo
+        hist = ttk.Frame(dice_box)
+        hist.pack(side=tk.TOP, fill=tk.X, pady=(10, 0))
+        self.btn_undo = ttk.Button(hist, text="Undo", command=self._undo, state=tk.DISABLED)
+        self.btn_redo = ttk.Button(hist, text="Redo", command=self._redo, state=tk.DISABLED)
+        self.btn_undo.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.btn_redo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(6, 0))
+
         # Cards
         cards_box = ttk.Labelframe(side, text="Your Cards", padding=10)
         cards_box.pack(side=tk.TOP, fill=tk.X, pady=(10, 0))
@@ -151,7 +162,12 @@ class ClueUI(tk.Tk):
         for i, name in enumerate(items):
             var = tk.BooleanVar(value=False)
             self._note_vars[title][name] = var
-            cb = ttk.Checkbutton(frame, text=name, variable=var)
+            cb = ttk.Checkbutton(
+                frame,
+                text=name,
+                variable=var,
+                command=lambda c=title, n=name, v=var: self._on_note_toggle(c, n, v),
+            )
             cb.grid(row=i, column=0, sticky="w", pady=2)
 
     def _bind_keys(self):
@@ -159,6 +175,9 @@ class ClueUI(tk.Tk):
         self.bind("<Down>", lambda e: self._move("down"))
         self.bind("<Left>", lambda e: self._move("left"))
         self.bind("<Right>", lambda e: self._move("right"))
+        self.canvas.bind("<Button-1>", self._on_board_click)
+        self.bind("<Control-z>", lambda e: self._undo())
+        self.bind("<Control-y>", lambda e: self._redo())
 
     # ----- State & Refresh ------------------------------------------------
 
@@ -185,6 +204,9 @@ class ClueUI(tk.Tk):
         self.btn_left.config(state=state)
         self.btn_right.config(state=state)
 
+        self.btn_undo.config(state=tk.NORMAL if self.game.can_undo() else tk.DISABLED)
+        self.btn_redo.config(state=tk.NORMAL if self.game.can_redo() else tk.DISABLED)
+
     def _refresh_cards(self):
         self.cards_list.delete(0, tk.END)
         for c in self._current_player().hand:
@@ -195,7 +217,12 @@ class ClueUI(tk.Tk):
 
         for category, items in self._note_vars.items():
             for name, var in items.items():
-                player.notes[category][name] = var.get()
+                self.game.set_note(player, category, name, var.get())
+
+    def _on_note_toggle(self, category: str, name: str, var: tk.BooleanVar):
+        # Each notepad change is recorded so it can be undone
+        self.game.set_note(self._current_player(), category, name, var.get())
+        self._refresh_controls()
 
     def _load_current_player_notes(self):
         player = self.game.current_player()
@@ -291,38 +318,57 @@ class ClueUI(tk.Tk):
             return
         success = self.game.get_movement(direction)
         if success:
-            self.moves_remaining -= 1
-            self._refresh_all()
-            # Check if entered a room
-            room_name = self.board.get_room_at_player(self._current_player())
-            if room_name:
-                self.btn_suggest.config(state=tk.NORMAL)
-                self.btn_accuse.config(state=tk.NORMAL)
-                self.moves_remaining = 0
-                self._set_status(f"{self._current_player().name} entered {room_name}.")
+            self._after_move()
         else:
             self._set_status("Cannot move there!")
 
+    def _after_move(self):
+        self.moves_remaining = self.game.get_moves_remaining()
+        self._refresh_all()
+        # Check if entered a room
+        room_name = self.board.get_room_at_player(self._current_player())
+        if room_name:
+            self.btn_suggest.config(state=tk.NORMAL)
+            self.btn_accuse.config(state=tk.NORMAL)
+            self.moves_remaining = 0
+            self._set_status(f"{self._current_player().name} entered {room_name}.")
+
+    def _on_board_click(self, event):
+        gs = self.board.grid_size
+        r, c = event.y // self.TILE, event.x // self.TILE
+        if not (0 <= r < gs and 0 <= c < gs):
+            return
+        room = self.board.room_entrances.get(rc_to_pos(r, c, gs))
+        if not room or self.moves_remaining <= 0:
+            return
+        # Walk toward the clicked room as one move, using the precomputed path
+        if self.game.move_toward_room(room):
+            self._after_move()
+
     def _suggest(self):
         room = self.board.get_room_at_player(self._current_player())
         if not room:
             self._set_status("You must be in a room to make a suggestion.")
             return
-        from tkinter.simpledialog import askstring
-        # Collect suspect, weapon, room
-        dialog = SuggestAccuseDialog(
-            self,
+        # Collect suspect, weapon, room - result arrives in _on_suggest_done
+        self.btn_suggest.config(state=tk.DISABLED)
+        self.btn_accuse.config(state=tk.DISABLED)
+        self.dialog.open(
             "Make Suggestion",
             self.cards.suspects,
             self.cards.weapons,
             [room],
-            room_fixed=True
+            room_fixed=True,
+            on_done=self._on_suggest_done,
         )
-        result = dialog.result
+
+    def _on_suggest_done(self, result):
         if result:
             s, w, r = result
             res = self.game.handle_room_action("suggestion", s, w, r)
-            if res["card_shown"]:
+            if res is None:
+                self._set_status("You already made a suggestion or accusation this turn.")
+            elif res["card_shown"]:
                 self._set_status(f"Card shown: {res['card_shown']}")
             else:
                 self._set_status("No card shown")
@@ -333,20 +379,25 @@ class ClueUI(tk.Tk):
         self.moves_remaining = 0
 
     def _accuse(self):
-        room = self.board.get_room_at_player(self._current_player())
-        dialog = SuggestAccuseDialog(
-            self,
+        # Collect suspect, weapon, room - result arrives in _on_accuse_done
+        self.btn_suggest.config(state=tk.DISABLED)
+        self.btn_accuse.config(state=tk.DISABLED)
+        self.dialog.open(
             "Make Accusation",
             self.cards.suspects,
             self.cards.weapons,
             self.cards.rooms,
-            room_fixed=False
+            room_fixed=False,
+            on_done=self._on_accuse_done,
         )
-        result = dialog.result
+
+    def _on_accuse_done(self, result):
         if result:
             s, w, r = result
             res = self.game.handle_room_action("accusation", s, w, r)
-            if res["correct_accusation"]:
+            if res is None:
+                self._set_status("You already made a suggestion or accusation this turn.")
+            elif res["correct_accusation"]:
                 self._set_status(f"{self._current_player().name} won! Correct accusation.")
             else:
                 print(f"{self._current_player().name}")
@@ -364,48 +415,68 @@ class ClueUI(tk.Tk):
         self._load_current_player_notes()
         self._start_turn(self._current_player())
 
+    def _undo(self):
+        if self.game.undo():
+            self._sync_from_game()
+            self._set_status("Undid last action.")
+
+    def _redo(self):
+        if self.game.redo():
+            self._sync_from_game()
+            self._set_status("Redid action.")
+
+    # Rebuilds UI-side turn state after the game jumped to another point in its history
+    def _sync_from_game(self):
+        player = self._current_player()
+        self.moves_remaining = self.game.get_moves_remaining()
+        self._load_current_player_notes()
+
+        can_act = not (self.game.game_over or player.is_eliminated)
+        rolled = self.game.has_rolled()
+        in_room = self.board.get_room_at_player(player) is not None
+        self.btn_roll.config(state=tk.NORMAL if can_act and not rolled else tk.DISABLED)
+        room_state = tk.NORMAL if can_act and rolled and in_room and not self.game.room_action_taken() else tk.DISABLED
+        self.btn_suggest.config(state=room_state)
+        self.btn_accuse.config(state=room_state)
+        self._refresh_all()
+
 
 # --- Suggest/Accuse Dialog -----------------------------------------------
 
 class SuggestAccuseDialog(tk.Toplevel):
-    def __init__(
-        self,
-        parent: tk.Tk,
-        title: str,
-        suspects: list[str],
-        weapons: list[str],
-        rooms: list[str],
-        room_fixed: bool,
-    ):
+    """Reusable suggestion/accusation picker.
+
+    Built once and kept hidden; open() shows it and returns immediately.
+    The choice is delivered to on_done as (suspect, weapon, room), or None
+    if cancelled, so the main event loop keeps running while it is open.
+    """
+
+    def __init__(self, parent: tk.Tk):
         super().__init__(parent)
-        self.title(title)
+        self.withdraw()
+        self.parent = parent
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
         self.result = None
+        self._on_done = None
 
         pad = 12
         outer = ttk.Frame(self, padding=pad)
         outer.pack(fill=tk.BOTH, expand=True)
 
-        ttk.Label(outer, text=title, font=("Segoe UI", 12, "bold")).grid(row=0, column=0, columnspan=2, sticky="w")
+        self.lbl_title = ttk.Label(outer, text="", font=("Segoe UI", 12, "bold"))
+        self.lbl_title.grid(row=0, column=0, columnspan=2, sticky="w")
         ttk.Label(outer, text="Suspect:").grid(row=1, column=0, sticky="w", pady=(10, 2))
         ttk.Label(outer, text="Weapon:").grid(row=2, column=0, sticky="w", pady=2)
         ttk.Label(outer, text="Room:").grid(row=3, column=0, sticky="w", pady=2)
 
-        self.s_var = tk.StringVar(value=suspects[0] if suspects else "")
-        self.w_var = tk.StringVar(value=weapons[0] if weapons else "")
-        self.r_var = tk.StringVar(value=rooms[0] if rooms else "")
-
-        self.s_box = ttk.Combobox(outer, textvariable=self.s_var, values=suspects, state="readonly", width=24)
-        self.w_box = ttk.Combobox(outer, textvariable=self.w_var, values=weapons, state="readonly", width=24)
-        self.r_box = ttk.Combobox(
-            outer,
-            textvariable=self.r_var,
-            values=rooms,
-            state=("disabled" if room_fixed else "readonly"),
-            width=24,
-        )
+        self.s_var = tk.StringVar()
+        self.w_var = tk.StringVar()
+        self.r_var = tk.StringVar()
+
+        self.s_box = ttk.Combobox(outer, textvariable=self.s_var, state="readonly", width=24)
+        self.w_box = ttk.Combobox(outer, textvariable=self.w_var, state="readonly", width=24)
+        self.r_box = ttk.Combobox(outer, textvariable=self.r_var, state="readonly", width=24)
 
         self.s_box.grid(row=1, column=1, sticky="ew", pady=(10, 2))
         self.w_box.grid(row=2, column=1, sticky="ew", pady=2)
@@ -417,26 +488,57 @@ class SuggestAccuseDialog(tk.Toplevel):
         ttk.Button(btns, text="Confirm", command=self._confirm).pack(side=tk.RIGHT)
 
         outer.grid_columnconfigure(1, weight=1)
+
+        self.protocol("WM_DELETE_WINDOW", self._cancel)
+
+    def open(
+        self,
+        title: str,
+        suspects: list[str],
+        weapons: list[str],
+        rooms: list[str],
+        room_fixed: bool,
+        on_done,
+    ):
+        """Show the dialog with the given choices; does not block."""
+        self.title(title)
+        self.lbl_title.config(text=title)
+        self.result = None
+        self._on_done = on_done
+
+        self.s_box.config(values=suspects)
+        self.w_box.config(values=weapons)
+        self.r_box.config(values=rooms, state=("disabled" if room_fixed else "readonly"))
+        self.s_var.set(suspects[0] if suspects else "")
+        self.w_var.set(weapons[0] if weapons else "")
+        self.r_var.set(rooms[0] if rooms else "")
+
         # Center on parent
-        self.update_idletasks()
-        px = parent.winfo_rootx() + 80
-        py = parent.winfo_rooty() + 80
+        px = self.parent.winfo_rootx() + 80
+        py = self.parent.winfo_rooty() + 80
         self.geometry(f"+{px}+{py}")
 
-        self.protocol("WM_DELETE_WINDOW", self._cancel)
-        self.wait_window(self)
+        self.deiconify()
+        self.lift()
+        # Grab input only - no nested event loop, timers keep firing
+        self.grab_set()
 
     def _confirm(self):
         s = self.s_var.get().strip()
         w = self.w_var.get().strip()
         r = self.r_var.get().strip()
         if not (s and w and r):
-            messagebox.showerror("Missing info", "Please select suspect, weapon, and room.")
+            messagebox.showerror("Missing info", "Please select suspect, weapon, and room.", parent=self)
             return
-        self.result = (s, w, r)
-        self.destroy()
+        self._close((s, w, r))
 
     def _cancel(self):
-        self.result = None
-        self.destroy()
-
+        self._close(None)
+
+    def _close(self, result):
+        self.result = result
+        self.grab_release()
+        self.withdraw()
+        on_done, self._on_done = self._on_done, None
+        if on_done:
+            on_done(result)
@@ -17,35 +17,43 @@ class BoardManager:
         for i, player in enumerate(players):        # Loop places each player in their starting position
             player.position = self.start_positions[i]
 
-    # Player movement function
-    def move_player(self, player, direction) -> bool:
-        new_position = player.position
+    # Returns the position reached by moving one square from 'position' in 'direction', or None if the move is invalid
+    def get_new_position(self, position, direction):
+        new_position = position
 
         # Movement validations 
         if direction == "up":
-            if player.position > self.grid_size:    # IF player is NOT in top row...
+            if position > self.grid_size:           # IF player is NOT in top row...
                 new_position -= self.grid_size      # allow player to move up 1 square
             else:                                   # ELSE movement is invalid
-                return False
+                return None
         elif direction == "down":
-            if player.position <= self.grid_size * (self.grid_size - 1):    # IF player is NOT in bottom row...
+            if position <= self.grid_size * (self.grid_size - 1):           # IF player is NOT in bottom row...
                 new_position += self.grid_size                              # allow player to move down 1 square
             else:                                                           # ELSE movement is invalid
-                return False
+                return None
         elif direction == "left":
-            if (player.position - 1) % self.grid_size != 0:                 # IF player is NOT in left column...
+            if (position - 1) % self.grid_size != 0:                        # IF player is NOT in left column...
                 new_position -= 1                                           # allow player to move left 1 square
             else:                                                           # ELSE movement is invalid
-                return False
+                return None
         elif direction == "right":
-            if player.position % self.grid_size != 0:                       # IF player is NOT in right column...
+            if position % self.grid_size != 0:                              # IF player is NOT in right column...
                 new_position += 1                                           # allow player to move right 1 square
             else:                                                           # ELSE movement is invalid
-                return False
+                return None
         else:
-            return False                            # Player did not enter a valid direction... movement is invalid
+            return None                             # Player did not enter a valid direction... movement is invalid
 
         if new_position in self.room_walls:         # IF player moves into a position located in 'room_walls' list, movement is invalid
+            return None
+
+        return new_position
+
+    # Player movement function
+    def move_player(self, player, direction) -> bool:
+        new_position = self.get_new_position(player.position, direction)
+        if new_position is None:                    # Movement is invalid
             return False
 
         player.position = new_position              # Movement is valid, update player.position
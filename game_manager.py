@@ -4,10 +4,12 @@ from card_manager import CardManager
 from turn_manager import TurnManager
 from board_manager import BoardManager
 from player import Player
+from history_manager import HistoryManager
+from movement_tables import load_tables
 
 # GameManager acts as the middle man for logic - UI asks GameManager for a result, GameManager retrieves result from other modules
 class GameManager:
-    def __init__(self, player_names):   # Initialization function
+    def __init__(self, player_names, record_history=True):   # Initialization function
         # Create Players
         self.players = [Player("Red"), Player("Blue"), Player("Yellow"), Player("Green")]
 
@@ -22,9 +24,15 @@ class GameManager:
         self.turn_manager = TurnManager(self)
         self.board_manager = BoardManager(self.players)
 
+        # Precomputed paths to each room for this board layout (shared via mmap)
+        self.movement_tables = load_tables(self.board_manager)
+
         # Request card setup from CardManager
         self.card_manager.setup_cards()
 
+        # Start undo/redo history from the initial game state (headless games can turn it off)
+        self.history = HistoryManager(self) if record_history else None
+
     # Tracks the current player 
     def current_player(self):
         return self.players[self.current_player_index]
@@ -34,17 +42,23 @@ class GameManager:
         if self.game_over:
             return
 
+        before = self._snapshot("current_player_index", "moves_remaining", "has_rolled", "room_action_taken")
+        self.turn_manager.end_turn()
         for _ in range(len(self.players)):
             self.current_player_index = (self.current_player_index + 1) % len(self.players)
             if not self.current_player().is_eliminated:
                 break
+        self._record(before)
 
     # Turn action functions
     # Retrieves dice roll from turnManager
     def dice_roll(self) -> int:
         if self.game_over or self.current_player().is_eliminated:
             return 0
-        return self.turn_manager.start_turn(self.current_player())
+        before = self._snapshot("moves_remaining", "has_rolled")
+        roll = self.turn_manager.start_turn(self.current_player())
+        self._record(before, barrier=True)     # Undo must not re-roll the dice
+        return roll
 
     # Retrieves moves remaining from turnManager
     def get_moves_remaining(self):
@@ -54,7 +68,21 @@ class GameManager:
     def get_movement(self, direction: str) -> bool:
         if self.game_over or self.current_player().is_eliminated:
             return False
-        return self.turn_manager.move_player(self.current_player(), direction, self.board_manager)
+        before = self._snapshot(("position", self.current_player_index), "moves_remaining")
+        moved = self.turn_manager.move_player(self.current_player(), direction, self.board_manager)
+        if moved:
+            self._record(before)
+        return moved
+
+    # Moves the current player toward a room using the precomputed movement tables
+    def move_toward_room(self, room: str) -> bool:
+        if self.game_over or self.current_player().is_eliminated:
+            return False
+        before = self._snapshot(("position", self.current_player_index), "moves_remaining")
+        moved = self.turn_manager.move_toward_room(self.current_player(), room, self.movement_tables, self.board_manager)
+        if moved:
+            self._record(before)
+        return moved
 
     # Retrieves results of suggestions/accusations from turnManager, handles eliminations/game over
     def handle_room_action(self, action: str, suspect: str, weapon: str, room: str):
@@ -64,17 +92,66 @@ class GameManager:
         
         if self.game_over or self.current_player().is_eliminated:
             return None
-        
+
+        # Only one suggestion or accusation per turn
+        if self.turn_manager.room_action_taken:
+            return None
+
+        before = self._snapshot(("eliminated", self.current_player_index), "game_over", "room_action_taken")
         result = self.turn_manager.room_entered(self.current_player(), action, suspect, weapon, room)
 
-        if result.get("eliminated"):
-            # Debug line...
-            #print(f"{self.current_player().name}")
-            return result
-        elif result.get("game_over"):
+        # Debug line...
+        #if result.get("eliminated"): print(f"{self.current_player().name}")
+        if not result.get("eliminated") and result.get("game_over"):
             self.game_over = True
+
+        self._record(before, barrier=True)     # Undo must not take back revealed cards or a wrong accusation
         return result
 
+    # Updates one entry in a player's notepad and records it so it can be undone
+    def set_note(self, player, category, name, value):
+        before = self._snapshot(("notes", self.players.index(player), category, name))
+        player.notes[category][name] = value
+        self._record(before)
+
+    # History helpers - take the values an action may change before it runs, record the step after
+    def _snapshot(self, *keys):
+        return self.history.snapshot(keys) if self.history else None
+
+    def _record(self, before, barrier=False):
+        return self.history.record(before, barrier) if self.history else None
+
+    # Undo/redo functions - each returns False if there is nothing to undo/redo
+    # Rolls, suggestions and accusations are barriers: undo stops there so dice and revealed cards stay final
+    def undo(self):
+        return self.history.undo() if self.history else False
+
+    def redo(self):
+        return self.history.redo() if self.history else False
+
+    def can_undo(self):
+        return self.history.can_undo() if self.history else False
+
+    def can_redo(self):
+        return self.history.can_redo() if self.history else False
+
+    # Branching for analysis tools - history_point() marks the current step, jump_to() returns to any marked step
+    # (ignoring undo barriers); new actions after a jump start a new branch and keep the old one
+    def history_point(self):
+        return self.history.current if self.history else None
+
+    def jump_to(self, node):
+        if not self.history:
+            return False
+        self.history.jump_to(node)
+        return True
+
+    def room_action_taken(self):
+        return self.turn_manager.room_action_taken
+
+    def has_rolled(self):
+        return self.turn_manager.has_rolled
+
     # Verifies accusations using the solution stored in cardManager
     def check_accusation(self, player, suspect, weapon, room):
         solution = self.card_manager.solution
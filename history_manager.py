@@ -0,0 +1,139 @@
+# HistoryNode is one recorded step: only the values that step changed, linked to the step before it
+class HistoryNode:
+    def __init__(self, parent, changes, barrier=False):    # Initialization function
+        self.parent = parent                # Previous step (None for the start of the game)
+        self.changes = changes              # {key: (old value, new value)} for each value this step changed
+        self.barrier = barrier              # True if undo() may not step back past this node (rolls, room actions)
+        self.children = []                  # Steps recorded after this one - more than one means the game branched
+        self.redo_child = None              # Child that redo() moves to
+        self.depth = 0 if parent is None else parent.depth + 1
+
+
+# HistoryManager keeps an undo/redo tree of game states for GameManager
+# Each step stores only the old and new values of what its action touched and shares everything else
+# with the steps before it, so memory grows with the number of actions rather than the size of the game,
+# and recording, undo and redo only touch what one action changed
+#
+# Keys name one tracked value:
+#   "current_player_index", "moves_remaining", "has_rolled", "room_action_taken", "game_over"
+#   ("position", player_index), ("eliminated", player_index), ("notes", player_index, category, name)
+class HistoryManager:
+    def __init__(self, game_manager):       # Initialization function
+        self.game_manager = game_manager
+        self.root = HistoryNode(None, {})   # Start of the game
+        self.current = self.root            # Step the game is currently at
+
+    # Returns the current value for a key (an unset notepad entry reads as False, like an unticked checkbox)
+    def read(self, key):
+        gm = self.game_manager
+        if key == "current_player_index":
+            return gm.current_player_index
+        if key == "moves_remaining":
+            return gm.turn_manager.moves_remaining
+        if key == "has_rolled":
+            return gm.turn_manager.has_rolled
+        if key == "room_action_taken":
+            return gm.turn_manager.room_action_taken
+        if key == "game_over":
+            return gm.game_over
+        if key[0] == "position":
+            return gm.players[key[1]].position
+        if key[0] == "eliminated":
+            return gm.players[key[1]].is_eliminated
+        if key[0] == "notes":
+            return gm.players[key[1]].notes[key[2]].get(key[3], False)
+        raise KeyError(key)
+
+    # Writes one tracked value back into the game
+    def restore(self, key, value):
+        gm = self.game_manager
+        if key == "current_player_index":
+            gm.current_player_index = value
+        elif key == "moves_remaining":
+            gm.turn_manager.moves_remaining = value
+        elif key == "has_rolled":
+            gm.turn_manager.has_rolled = value
+        elif key == "room_action_taken":
+            gm.turn_manager.room_action_taken = value
+        elif key == "game_over":
+            gm.game_over = value
+        elif key[0] == "position":
+            gm.players[key[1]].position = value
+        elif key[0] == "eliminated":
+            gm.players[key[1]].is_eliminated = value
+        elif key[0] == "notes":
+            gm.players[key[1]].notes[key[2]][key[3]] = value
+        else:
+            raise KeyError(key)
+
+    # Reads the values an action may change - pass the result to record() once the action is done
+    def snapshot(self, keys):
+        return {key: self.read(key) for key in keys}
+
+    # Records whatever changed since 'before' was taken as a new step - returns the new node, or None if nothing changed
+    def record(self, before, barrier=False):
+        changes = {}
+        for key, old in before.items():
+            new = self.read(key)
+            if old != new:
+                changes[key] = (old, new)
+        if not changes:
+            return None
+
+        node = HistoryNode(self.current, changes, barrier)
+        self.current.children.append(node)
+        self.current.redo_child = node
+        self.current = node
+        return node
+
+    def can_undo(self):
+        return self.current.parent is not None and not self.current.barrier
+
+    def can_redo(self):
+        return self.current.redo_child is not None
+
+    # Steps back one action - returns False at the start of the game or at a barrier (roll, suggestion, accusation)
+    def undo(self):
+        if not self.can_undo():
+            return False
+        self._step_back()
+        return True
+
+    # Steps forward along the most recently undone branch - returns False if there is nothing to redo
+    def redo(self):
+        if not self.can_redo():
+            return False
+        self._step_forward(self.current.redo_child)
+        return True
+
+    # Moves the game to any recorded step, e.g. to branch an analysis from an earlier point
+    # Unlike undo(), this ignores barriers - it is meant for analysis tooling, not for players
+    def jump_to(self, node):
+        # Walk both sides up to their common ancestor
+        path = []
+        while node.depth > self.current.depth:
+            path.append(node)
+            node = node.parent
+        while self.current.depth > node.depth:
+            self._step_back()
+        while node is not self.current:
+            path.append(node)
+            node = node.parent
+            self._step_back()
+
+        # Replay down to the target
+        for node in reversed(path):
+            self._step_forward(node)
+
+    def _step_back(self):
+        node = self.current
+        for key, (old, new) in node.changes.items():
+            self.restore(key, old)
+        node.parent.redo_child = node
+        self.current = node.parent
+
+    def _step_forward(self, node):
+        for key, (old, new) in node.changes.items():
+            self.restore(key, new)
+        self.current.redo_child = node
+        self.current = node
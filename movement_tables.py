@@ -0,0 +1,247 @@
+"""
+movement_tables.py - Precomputed movement tables for a board layout
+
+For every square and every room, the compiler stores the shortest distance
+to the room entrance, the first step to take toward it, and the square a
+player ends on when spending 1-12 moves walking toward it (a full dice
+total, or what is left of one). The tables are written to a binary file
+named after a hash of the layout (grid size, room_walls, room_entrances)
+and loaded at runtime with mmap, so every process shares one read-only
+page-cache copy.
+
+load_tables() compiles the file the first time a layout is seen; it can
+also be built ahead of time with:
+    python movement_tables.py
+"""
+
+from __future__ import annotations
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from collections import deque
+
+DIRECTIONS = ("up", "down", "left", "right")
+MIN_MOVES = 1       # Lowest dice total is 2, but a partly used roll can leave a single move
+MAX_MOVES = 12
+UNREACHABLE = 0xFFFF
+
+TABLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "movement_tables")
+
+# File layout (little-endian):
+#   header: magic, grid size, room count, layout hash
+#   rooms:  entrance position (u16) for each room, in sorted entrance order
+#   dist:   u16 [square][room]                 - steps to room, UNREACHABLE if none
+#   step:   u8  [square][room]                 - 1-based index into DIRECTIONS, 0 if none
+#   dest:   u16 [square][room][moves 1..12]    - square reached after spending that many moves
+_MAGIC = b"CLUEMV02"
+_HEADER = struct.Struct("<8sHH32s")
+
+
+# --- Layout ---------------------------------------------------------------
+
+def layout_hash(board) -> bytes:
+    """SHA-256 of everything that affects movement on this board."""
+    h = hashlib.sha256()
+    h.update(struct.pack("<H", board.grid_size))
+    for pos in sorted(board.room_walls):
+        h.update(struct.pack("<H", pos))
+    for pos in sorted(board.room_entrances):
+        h.update(struct.pack("<H", pos))
+        h.update(board.room_entrances[pos].encode("utf-8") + b"\0")
+    return h.digest()
+
+
+def table_path(board, directory: str = TABLE_DIR) -> str:
+    """Path of the compiled table file for this board's layout."""
+    return os.path.join(directory, f"movement_{layout_hash(board).hex()[:16]}.bin")
+
+
+# --- Compiler -------------------------------------------------------------
+
+def _room_distances(board, target):
+    """Shortest distances to 'target' for every square.
+
+    Other room entrances end a move when stepped on, so paths never pass
+    through them; a player starting on one still gets a distance.
+    """
+    entrances = set(board.room_entrances)
+    dist = {target: 0}
+    queue = deque([target])
+    while queue:
+        pos = queue.popleft()
+        for direction in DIRECTIONS:
+            nxt = board.get_new_position(pos, direction)
+            if nxt is None or nxt in dist or nxt in entrances:
+                continue
+            dist[nxt] = dist[pos] + 1
+            queue.append(nxt)
+
+    for pos in entrances:
+        if pos == target:
+            continue
+        neighbours = [dist[n] for n in (board.get_new_position(pos, d) for d in DIRECTIONS) if n in dist]
+        if neighbours:
+            dist[pos] = min(neighbours) + 1
+    return dist
+
+
+def _first_step(board, dist, target, pos):
+    """Index of the direction that gets closest to the room, or None."""
+    best, best_dist = None, dist.get(pos, UNREACHABLE)
+    for i, direction in enumerate(DIRECTIONS):
+        nxt = board.get_new_position(pos, direction)
+        if nxt is None or (nxt in board.room_entrances and nxt != target):
+            continue
+        if dist.get(nxt, UNREACHABLE) < best_dist:
+            best, best_dist = i, dist[nxt]
+    return best
+
+
+def compile_tables(board, directory: str = TABLE_DIR) -> str:
+    """Build the tables for this board and write them to disk. Returns the file path."""
+    squares = board.grid_size * board.grid_size
+    entrances = sorted(board.room_entrances)
+    moves_count = MAX_MOVES - MIN_MOVES + 1
+
+    dist_table = [UNREACHABLE] * (squares * len(entrances))
+    step_table = [0] * (squares * len(entrances))
+    dest_table = [0] * (squares * len(entrances) * moves_count)
+
+    for r, target in enumerate(entrances):
+        dist = _room_distances(board, target)
+
+        # First step from every square toward this room
+        steps = {}
+        for pos in range(1, squares + 1):
+            i = (pos - 1) * len(entrances) + r
+            if pos in dist:
+                dist_table[i] = dist[pos]
+            step = _first_step(board, dist, target, pos)
+            if step is not None:
+                steps[pos] = step
+                step_table[i] = step + 1
+
+        # Walk each number of moves, stopping on any room entrance like a real move does
+        for pos in range(1, squares + 1):
+            base = ((pos - 1) * len(entrances) + r) * moves_count
+            current = pos
+            moved = False
+            for m in range(1, MAX_MOVES + 1):
+                if current in steps and not (moved and current in board.room_entrances):
+                    current = board.get_new_position(current, DIRECTIONS[steps[current]])
+                    moved = True
+                if m >= MIN_MOVES:
+                    dest_table[base + m - MIN_MOVES] = current
+
+    os.makedirs(directory, exist_ok=True)
+    path = table_path(board, directory)
+    # Each writer gets its own temp file, so processes compiling at the same time never share one
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, board.grid_size, len(entrances), layout_hash(board)))
+            f.write(struct.pack(f"<{len(entrances)}H", *entrances))
+            f.write(struct.pack(f"<{len(dist_table)}H", *dist_table))
+            f.write(bytes(step_table))
+            f.write(struct.pack(f"<{len(dest_table)}H", *dest_table))
+        os.chmod(tmp_path, 0o644)   # mkstemp creates the file owner-only
+        os.replace(tmp_path, path)  # Readers never see a half-written file
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return path
+
+
+def _expected_size(grid_size: int, room_count: int) -> int:
+    """Size in bytes of a table file with these dimensions."""
+    cells = grid_size * grid_size * room_count
+    moves_count = MAX_MOVES - MIN_MOVES + 1
+    return _HEADER.size + 2 * room_count + 2 * cells + cells + 2 * cells * moves_count
+
+
+# --- Runtime lookups ------------------------------------------------------
+
+class MovementTables:
+    """Read-only view over a compiled table file, backed by mmap."""
+
+    def __init__(self, board, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mm) < _HEADER.size:
+            self._mm.close()
+            raise ValueError(f"{path} is too short to be a movement table file")
+
+        magic, grid_size, room_count, digest = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or digest != layout_hash(board):
+            self._mm.close()
+            raise ValueError(f"{path} does not match this board layout")
+        if len(self._mm) != _expected_size(grid_size, room_count):
+            size = len(self._mm)
+            self._mm.close()
+            raise ValueError(f"{path} is {size} bytes, expected {_expected_size(grid_size, room_count)} - recompile it")
+
+        self.grid_size = grid_size
+        self._rooms = room_count
+        self._moves = MAX_MOVES - MIN_MOVES + 1
+        entrances = struct.unpack_from(f"<{room_count}H", self._mm, _HEADER.size)
+        self._room_index = {board.room_entrances[pos]: i for i, pos in enumerate(entrances)}
+
+        squares = grid_size * grid_size
+        self._dist_off = _HEADER.size + 2 * room_count
+        self._step_off = self._dist_off + 2 * squares * room_count
+        self._dest_off = self._step_off + squares * room_count
+
+    def _cell(self, pos: int, room: str) -> int:
+        return (pos - 1) * self._rooms + self._room_index[room]
+
+    def distance(self, pos: int, room: str) -> int | None:
+        """Number of steps from 'pos' to the room's entrance, or None if unreachable."""
+        (dist,) = struct.unpack_from("<H", self._mm, self._dist_off + 2 * self._cell(pos, room))
+        return None if dist == UNREACHABLE else dist
+
+    def next_direction(self, pos: int, room: str) -> str | None:
+        """Direction of the first step from 'pos' toward the room, or None if there is none."""
+        step = self._mm[self._step_off + self._cell(pos, room)]
+        return DIRECTIONS[step - 1] if step else None
+
+    def destination(self, pos: int, room: str, moves: int) -> int:
+        """Square reached by spending up to 'moves' (1-12) walking toward the room."""
+        moves = min(moves, MAX_MOVES)
+        i = self._cell(pos, room) * self._moves + moves - MIN_MOVES
+        (dest,) = struct.unpack_from("<H", self._mm, self._dest_off + 2 * i)
+        return dest
+
+    def close(self):
+        self._mm.close()
+
+
+_loaded: dict[bytes, MovementTables] = {}
+
+
+def load_tables(board, directory: str = TABLE_DIR) -> MovementTables:
+    """Map the tables for this board, compiling them first if this layout has no file yet.
+
+    Results are cached per layout, so each process maps the file once.
+    """
+    key = layout_hash(board)
+    if key not in _loaded:
+        path = table_path(board, directory)
+        if not os.path.exists(path):
+            compile_tables(board, directory)
+        _loaded[key] = MovementTables(board, path)
+    return _loaded[key]
+
+
+def main():
+    from board_manager import BoardManager
+
+    board = BoardManager([])
+    path = compile_tables(board)
+    print(f"Wrote movement tables to {path}")
+
+
+if __name__ == "__main__":      # Only runs main() function if this file is executed directly
+    main()
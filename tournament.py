@@ -0,0 +1,348 @@
+"""
+tournament.py - Policy vs. policy tournament runner for GameManager
+
+Plays seat-rotated games between two play policies across a process pool,
+reports win-rate / Elo estimates with confidence intervals, and stops early
+once a sequential probability ratio test (SPRT) reaches a decision.
+
+Run:
+    python tournament.py greedy random --alpha 0.05 --beta 0.05 --elo1 50
+"""
+
+from __future__ import annotations
+import argparse
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from board_manager import BoardManager
+from game_manager import GameManager
+from movement_tables import load_tables
+
+DIRECTIONS = ("up", "down", "left", "right")
+
+
+# --- Policy helpers -------------------------------------------------------
+
+def _card_category(game, card):
+    """Return the notepad category ("Suspects"/"Weapons"/"Rooms") for a card."""
+    cards = game.card_manager
+    if card in cards.suspects:
+        return "Suspects"
+    if card in cards.weapons:
+        return "Weapons"
+    return "Rooms"
+
+
+def _mark_seen(game, player, card):
+    """Cross a card off the player's notepad, the same way the UI checkbox does."""
+    game.set_note(player, _card_category(game, card), card, True)
+
+
+def _unknown_cards(game, player):
+    """Return (suspects, weapons, rooms) not yet crossed off or held by the player."""
+    cards = game.card_manager
+
+    def unknown(category, items):
+        return [c for c in items if c not in player.hand and not player.notes[category].get(c, False)]
+
+    return (
+        unknown("Suspects", cards.suspects),
+        unknown("Weapons", cards.weapons),
+        unknown("Rooms", cards.rooms),
+    )
+
+
+def _walk(game, player, moves, choose_direction):
+    """Spend up to 'moves' steps using choose_direction; stop early on entering a room."""
+    board = game.board_manager
+    for _ in range(moves):
+        direction = choose_direction(player.position)
+        if direction is None or not game.get_movement(direction):
+            break
+        if board.get_room_at_player(player):
+            break
+    return board.get_room_at_player(player)
+
+
+def _room_action(game, player, action, suspect, weapon, room):
+    """Run a suggestion/accusation through GameManager and record what was learned."""
+    result = game.handle_room_action(action, suspect, weapon, room)
+    if not result or action != "suggestion":
+        return result
+
+    if result.get("card_shown"):
+        _mark_seen(game, player, result["card_shown"])
+    else:
+        # Nobody could show a card, so each suggested card not in our hand is in the solution
+        cards = game.card_manager
+        for card, items in ((suspect, cards.suspects), (weapon, cards.weapons), (room, cards.rooms)):
+            if card not in player.hand:
+                for other in items:
+                    if other != card:
+                        _mark_seen(game, player, other)
+    return result
+
+
+# --- Policies -------------------------------------------------------------
+# A policy plays one full turn for game.current_player() using only the
+# GameManager API, under the same rules as ClueUI: one suggestion or
+# accusation per turn, made from a room. Policies must be module-level
+# functions so they can be sent to worker processes.
+
+def random_policy(game):
+    """Random walk; in a room, guesses once it has seen a few cards, otherwise suggests at random."""
+    player = game.current_player()
+    board = game.board_manager
+    moves = game.dice_roll()
+
+    def choose(pos):
+        options = [d for d in DIRECTIONS if board.get_new_position(pos, d) is not None]
+        return random.choice(options) if options else None
+
+    room = _walk(game, player, moves, choose)
+    if not room:
+        return
+
+    suspects, weapons, rooms = _unknown_cards(game, player)
+    if len(suspects) * len(weapons) * len(rooms) <= 2:
+        _room_action(game, player, "accusation",
+                     random.choice(suspects), random.choice(weapons), random.choice(rooms))
+    else:
+        cards = game.card_manager
+        suspect, weapon = random.choice(cards.suspects), random.choice(cards.weapons)
+        _room_action(game, player, "suggestion", suspect, weapon, room)
+
+
+def greedy_policy(game):
+    """Heads for the nearest unknown room; in a room, accuses when certain, otherwise suggests unknown cards."""
+    player = game.current_player()
+    board = game.board_manager
+    moves = game.dice_roll()
+
+    suspects, weapons, rooms = _unknown_cards(game, player)
+    targets = [pos for pos, name in board.room_entrances.items()
+               if name in rooms and pos != player.position]
+    if not targets:
+        targets = [pos for pos in board.room_entrances if pos != player.position]
+
+    # Head for the closest target room; the tables give the whole move in one lookup
+    tables = game.movement_tables
+    reachable = [(tables.distance(player.position, board.room_entrances[pos]), pos) for pos in targets]
+    reachable = [(dist, pos) for dist, pos in reachable if dist is not None]
+    if reachable and moves:
+        game.move_toward_room(board.room_entrances[min(reachable)[1]])
+
+    room = board.get_room_at_player(player)
+    if not room:
+        return
+
+    if len(suspects) == len(weapons) == len(rooms) == 1:
+        _room_action(game, player, "accusation", suspects[0], weapons[0], rooms[0])
+    else:
+        _room_action(game, player, "suggestion", suspects[0], weapons[0], room)
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+}
+
+
+# --- Single game ----------------------------------------------------------
+
+def play_game(seat_policies, seed, max_turns=500):
+    """Play one game with seat_policies[i] controlling player i.
+
+    Returns the winning seat index, or None for a draw (turn limit reached
+    or every player eliminated).
+    """
+    random.seed(seed)
+    game = GameManager(player_names=None, record_history=False)     # Nothing undoes headless games
+
+    for _ in range(max_turns):
+        player = game.current_player()
+        seat_policies[game.current_player_index](game)
+
+        if game.game_over:
+            return game.players.index(player)
+
+        active = game.get_active_players()
+        if len(active) == 1:
+            return game.players.index(active[0])
+        if not active:
+            return None
+
+        game.advance_turn()
+    return None
+
+
+def _play_match(policy_a, policy_b, game_index, seed, max_turns):
+    """Worker entry point: play one seat-rotated game and score it for policy A.
+
+    Returns 1.0 if A won, 0.0 if B won, None for a draw.
+    """
+    # Alternate A/B around the table and rotate which policy sits in seat 0
+    a_seat = game_index % 2
+    seats = [policy_a if i % 2 == a_seat else policy_b for i in range(4)]
+    winner = play_game([POLICIES[name] for name in seats], seed, max_turns)
+    if winner is None:
+        return None
+    return 1.0 if winner % 2 == a_seat else 0.0
+
+
+# --- Statistics -----------------------------------------------------------
+
+def elo_to_score(elo):
+    """Expected score for a player rated 'elo' points above the opponent."""
+    return 1.0 / (1.0 + 10 ** (-elo / 400.0))
+
+
+def score_to_elo(score):
+    """Elo difference implied by an expected score; unbounded (+/-inf) at a score of 0 or 1."""
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def wilson_interval(wins, n, z=1.96):
+    """Wilson score interval for a binomial proportion."""
+    if n == 0:
+        return 0.0, 1.0
+    p = wins / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+class SPRT:
+    """Bernoulli sequential probability ratio test of H0: elo=elo0 vs H1: elo=elo1."""
+
+    def __init__(self, elo0=0.0, elo1=50.0, alpha=0.05, beta=0.05):
+        self.p0 = elo_to_score(elo0)
+        self.p1 = elo_to_score(elo1)
+        self.lower = math.log(beta / (1 - alpha))
+        self.upper = math.log((1 - beta) / alpha)
+        self.llr = 0.0
+
+    def update(self, outcome):
+        """Add one decisive game (1.0 = A won, 0.0 = B won)."""
+        if outcome:
+            self.llr += math.log(self.p1 / self.p0)
+        else:
+            self.llr += math.log((1 - self.p1) / (1 - self.p0))
+
+    def decision(self):
+        """Return "H1", "H0" or None if the test should continue."""
+        if self.llr >= self.upper:
+            return "H1"
+        if self.llr <= self.lower:
+            return "H0"
+        return None
+
+
+# --- Tournament -----------------------------------------------------------
+
+def run_tournament(policy_a, policy_b, max_games=10000, elo0=0.0, elo1=50.0,
+                   alpha=0.05, beta=0.05, workers=None, seed=0, max_turns=500):
+    """Play policy_a against policy_b until the SPRT decides or max_games is reached.
+
+    Games are dispatched to a process pool a few at a time so the test can
+    stop shortly after its bounds are crossed. Returns a summary dict.
+    """
+    sprt = SPRT(elo0, elo1, alpha, beta)
+    wins = losses = draws = 0
+    decision = None
+    next_game = 0
+
+    # Compile (or map) the movement tables once here so workers only ever mmap the finished file
+    load_tables(BoardManager([]))
+
+    workers = workers or os.cpu_count() or 1
+    in_flight = 2 * workers     # Keep every worker busy without queueing games past a stop
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+
+        def submit():
+            nonlocal next_game
+            pending.add(pool.submit(_play_match, policy_a, policy_b, next_game, seed + next_game, max_turns))
+            next_game += 1
+
+        while next_game < max_games and len(pending) < in_flight:
+            submit()
+
+        while pending and decision is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                outcome = future.result()
+                if outcome is None:
+                    draws += 1
+                    continue
+                if outcome:
+                    wins += 1
+                else:
+                    losses += 1
+                sprt.update(outcome)
+                decision = decision or sprt.decision()
+            while decision is None and next_game < max_games and len(pending) < in_flight:
+                submit()
+
+        for future in pending:
+            future.cancel()
+
+    decisive = wins + losses
+    low, high = wilson_interval(wins, decisive)
+    win_rate = wins / decisive if decisive else 0.5
+    return {
+        "games": wins + losses + draws,
+        "wins": wins,
+        "losses": losses,
+        "draws": draws,
+        "win_rate": win_rate,
+        "win_rate_ci": (low, high),
+        "elo": score_to_elo(win_rate),
+        "elo_ci": (score_to_elo(low), score_to_elo(high)),
+        "llr": sprt.llr,
+        "llr_bounds": (sprt.lower, sprt.upper),
+        "decision": decision,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a policy vs. policy Clue tournament.")
+    parser.add_argument("policy_a", choices=sorted(POLICIES))
+    parser.add_argument("policy_b", choices=sorted(POLICIES))
+    parser.add_argument("--max-games", type=int, default=10000)
+    parser.add_argument("--elo0", type=float, default=0.0, help="Elo difference under H0")
+    parser.add_argument("--elo1", type=float, default=50.0, help="Elo difference under H1")
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--beta", type=float, default=0.05)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-turns", type=int, default=500)
+    args = parser.parse_args()
+
+    summary = run_tournament(
+        args.policy_a, args.policy_b,
+        max_games=args.max_games, elo0=args.elo0, elo1=args.elo1,
+        alpha=args.alpha, beta=args.beta, workers=args.workers,
+        seed=args.seed, max_turns=args.max_turns,
+    )
+
+    low, high = summary["win_rate_ci"]
+    elo_low, elo_high = summary["elo_ci"]
+    print(f"{args.policy_a} vs {args.policy_b}: {summary['games']} games "
+          f"(+{summary['wins']} -{summary['losses']} ={summary['draws']})")
+    print(f"Win rate: {summary['win_rate']:.3f} (95% CI {low:.3f} - {high:.3f})")
+    print(f"Elo: {summary['elo']:+.1f} (95% CI {elo_low:+.1f} - {elo_high:+.1f})")
+    print(f"SPRT: LLR {summary['llr']:.2f} in ({summary['llr_bounds'][0]:.2f}, "
+          f"{summary['llr_bounds'][1]:.2f}) -> {summary['decision'] or 'inconclusive'}")
+
+
+if __name__ == "__main__":      # Only runs main() function if this file is executed directly
+    main()
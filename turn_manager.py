@@ -6,6 +6,8 @@ class TurnManager:
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.moves_remaining = 0
+        self.has_rolled = False
+        self.room_action_taken = False      # Only one suggestion or accusation per turn
         self.current_player = None
 
     # Dice rolling function
@@ -19,15 +21,39 @@ class TurnManager:
     def start_turn(self, player):
         
         self.moves_remaining = self.roll_dice()
+        self.has_rolled = True
         return self.moves_remaining
 
+    # Clears turn state so the next player starts fresh
+    def end_turn(self):
+        self.moves_remaining = 0
+        self.has_rolled = False
+        self.room_action_taken = False
+
     # Returns remaining moves for player's turn
     def get_moves_remaining(self):
         return self.moves_remaining
 
     # Player movement check - runs move_player from board_manager and returns true if movement successful
     def move_player(self, player, direction, board_manager) -> bool:
-        return board_manager.move_player(player, direction)
+        moved = board_manager.move_player(player, direction)
+        if moved:
+            self.moves_remaining = max(0, self.moves_remaining - 1)
+            if board_manager.get_room_at_player(player):    # Entering a room ends movement for the turn
+                self.moves_remaining = 0
+        return moved
+
+    # Moves player along the precomputed path toward 'room' in one action, spending as many moves as the path needs
+    def move_toward_room(self, player, room, movement_tables, board_manager) -> bool:
+        distance = movement_tables.distance(player.position, room)
+        if not distance or self.moves_remaining <= 0:     # Already there, unreachable, or no moves left
+            return False
+
+        player.position = movement_tables.destination(player.position, room, self.moves_remaining)
+        self.moves_remaining = max(0, self.moves_remaining - distance)
+        if board_manager.get_room_at_player(player):    # Entering a room ends movement for the turn
+            self.moves_remaining = 0
+        return True
 
     # Checks suggestions/accusations upon entering a room
     def room_entered(self, player, action, suspect, weapon, room):
@@ -58,6 +84,9 @@ class TurnManager:
             shown_card = self.game_manager.check_suggestion(player, suspect, weapon, room)
             result["card_shown"] = shown_card
 
+        if action in ("accusation", "suggestion"):
+            self.room_action_taken = True
+
         return result
 
     